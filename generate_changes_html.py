@@ -1,21 +1,64 @@
 import json
-import os
 import html
+import mmap
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 
+# base URL の決定ロジックは RSS 生成側と共通（重複実装しない）
+from generate_rss import guess_base_url
 
-def guess_base_url() -> str:
-    site = (os.environ.get("SITE_URL") or "").strip()
-    if site:
-        return site.rstrip("/") + "/"
-    repo = os.environ.get("GITHUB_REPOSITORY", "")
-    if repo and "/" in repo:
-        owner, name = repo.split("/", 1)
-        return f"https://{owner}.github.io/{name}/"
-    return "http://localhost/"
+# サーバ側で静的に描画する行数（JS の既定表示 "Latest 100" に合わせる）
+STATIC_ROWS_LIMIT = 100
 
+try:
+    import orjson  # 任意依存（無ければ標準 json で動く）
+except ImportError:
+    orjson = None
 
+# <script> 要素の中身を途中で終わらせ得る並び（大文字小文字は区別しない）
+_SCRIPT_BREAKOUT_RE = re.compile(rb"<(?=/script|!--)", re.IGNORECASE)
+
+# diff 行の空白の連続を1つに畳む
+_WS_RE = re.compile(r"\s+")
+
+# summary に混ざった <br> の各表記
+_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+
+
+def _loads(data):
+    """state.json のパース。orjson があれば使う（大きい state で数倍速い）。
+
+    data は bytes / memoryview のどちらでもよい。
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data).decode("utf-8"))
+
+
+def _load_json_file(path: str):
+    """ファイルを mmap して、str へのデコードを挟まずにパーサへ渡す（ピークメモリ削減）。"""
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 空ファイルは mmap できない
+            return _loads(f.read())
+        with mm, memoryview(mm) as buf:
+            return _loads(buf)
+
+
+def _dumps(obj) -> bytes:
+    """埋め込み用 JSON を UTF-8 bytes で返す。ensure_ascii=False 相当（非ASCIIはそのまま）。
+
+    orjson は bytes を直接返すので、str へのデコード→再エンコードを挟まずに書き出せる。
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=4096)
 def iso_to_human(s: str) -> str:
     if not s:
         return ""
@@ -29,8 +72,60 @@ def iso_to_human(s: str) -> str:
         return s
 
 
+def _first(d: dict, *keys, default=""):
+    """keys を順に見て、最初の truthy な値を返す（旧フィールド名の吸収用）。"""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
+
+# 時刻フィールドの候補キー（並び替えキーにも使う）
+_TS_KEYS = ("ts", "time", "created", "created_at")
+
+# state.json の項目 → 旧フィールド名を含む候補キー（先頭ほど優先）。
+# 並びは main() のアンパック順（impact, source, url, title, ts, snippet, snippet_full, summary）
+_STR_FIELD_ALIASES = (
+    ("impact", "impact2"),
+    ("name", "source"),
+    ("url",),
+    ("title", "item_title"),
+    _TS_KEYS,
+    ("snippet",),
+    ("snippet_full", "snippet_full_for_state", "snippet_full_for_id"),
+    ("summary", "summary_ja", "summary3", "summary_3"),  # Japanese summary
+)
+
+# diff_stats が無い旧形式向けの候補キー
+_DIFF_STAT_ALIASES = (
+    ("added", ("added", "diff_added", "plus")),
+    ("removed", ("removed", "diff_removed", "minus")),
+    ("churn", ("churn", "diff_churn")),
+)
+
+
+def _first_str(d: dict, *keys) -> str:
+    """_first の文字列版。JSON 由来の値はほぼ str なので、その場合は str() を呼ばずに返す。"""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v if type(v) is str else str(v)
+    return ""
+
+
+def _item_ts(it: dict) -> str:
+    """並び替えキー兼表示用の時刻文字列（旧フィールド名も吸収）。"""
+    return _first_str(it, *_TS_KEYS)
+
+
 # --- Inserted helper functions for Japanese summary normalization and fallback ---
 def to_int(x, default: int = 0) -> int:
+    # state.json の数値はほぼ int のまま来る（bool は int 扱いさせないため type で判定）
+    if type(x) is int:
+        return x
+    if x is None:
+        return default
     try:
         return int(x)
     except Exception:
@@ -39,9 +134,15 @@ def to_int(x, default: int = 0) -> int:
 
 
 def first_n_lines(text: str, n: int = 3) -> str:
-    lines = [ln.strip() for ln in (text or "").split("\n")]
-    lines = [ln for ln in lines if ln]
-    return "\n".join(lines[:n])
+    # n 行集まった時点で打ち切る（残りの行は strip もしない）
+    out = []
+    for ln in (text or "").split("\n"):
+        if len(out) >= n:
+            break
+        ln = ln.strip()
+        if ln:
+            out.append(ln)
+    return "\n".join(out)
 
 
 # 新しい summary 正規化関数（summary, reasons, n行）を追加
@@ -55,11 +156,11 @@ def normalize_summary_text(summary: str, reasons: str = "", n: int = 3) -> str:
     s = (summary or "").strip()
     if not s:
         return ""
-    # HTML の <br> が混ざっていた場合にも耐える
-    s = s.replace("<br>", "\n").replace("<br/>", "\n").replace("<br />", "\n")
-    lines = [ln.strip() for ln in s.split("\n")]
+    # HTML の <br> が混ざっていた場合にも耐える（<br> / <br/> / <br /> / <BR> を1パスで）
+    s = _BR_RE.sub("\n", s)
     out = []
-    for ln in lines:
+    for ln in s.split("\n"):
+        ln = ln.strip()
         if not ln:
             continue
         # 先頭の「要約:」を除去
@@ -81,29 +182,44 @@ def _clean_diff_line(ln: str) -> str:
     ln = (ln or "").strip()
     if not ln:
         return ""
-    if ln.startswith(("+", "-", " ")):
+    # strip 済みなので先頭が空白になることはない（+/- だけ見ればよい）
+    if ln[0] in "+-":
         ln = ln[1:].strip()
-    ln = re.sub(r"\s+", " ", ln)
-    return ln[:160]
+    return _WS_RE.sub(" ", ln)[:160]
 
 
 def _pick_key_lines(diff_text: str):
-    added, removed = [], []
+    """差分から代表行（最初の追加行・最初の削除行）を拾う。
+
+    build_fallback_summary は先頭1行しか使わないので、両方見つかった時点で打ち切る。
+    戻り値は (added, removed) で、それぞれ 0〜1 要素の list。
+    """
+    first_added = first_removed = ""
     for ln in (diff_text or "").splitlines():
         if not ln:
             continue
         # ignore unified diff headers
         if ln.startswith(("+++", "---", "@@")):
             continue
-        if ln.startswith("+"):
-            s = _clean_diff_line(ln)
-            if s:
-                added.append(s)
-        elif ln.startswith("-"):
-            s = _clean_diff_line(ln)
-            if s:
-                removed.append(s)
-    return added, removed
+        if ln[0] == "+":
+            if not first_added:
+                first_added = _clean_diff_line(ln)
+        elif ln[0] == "-":
+            if not first_removed:
+                first_removed = _clean_diff_line(ln)
+        else:
+            continue
+        if first_added and first_removed:
+            break
+    return ([first_added] if first_added else []), ([first_removed] if first_removed else [])
+
+
+# build_fallback_summary の3行目（impact → 次アクション）
+_NEXT_ACTION = {
+    "Breaking": "次: 公式/原文を開いて影響（API/料金/規約/互換）を確認",
+    "High": "次: 公式/原文を開いて影響（API/料金/規約/互換）を確認",
+}
+_NEXT_ACTION_DEFAULT = "次: 必要なら公式/原文で一次情報を確認"
 
 
 def build_fallback_summary(
@@ -111,14 +227,16 @@ def build_fallback_summary(
     impact: str,
     title: str,
     reasons: str,
-    diff_stats: dict,
+    a: int,
+    r: int,
+    c: int,
     snippet_full: str,
     snippet: str,
 ) -> str:
-    """LLMなしでも『ぱっと見で分かる』日本語3行を作る（差分 +/− から生成）。"""
-    a = to_int((diff_stats or {}).get("added"), 0)
-    r = to_int((diff_stats or {}).get("removed"), 0)
-    c = to_int((diff_stats or {}).get("churn"), a + r)
+    """LLMなしでも『ぱっと見で分かる』日本語3行を作る（差分 +/− から生成）。
+
+    a / r / c は diff の追加・削除・churn 行数（呼び出し側で int 化済み）。
+    """
 
     src = (source or "unknown").strip()
     imp = (impact or "—").strip() or "—"
@@ -144,157 +262,33 @@ def build_fallback_summary(
         line2 = f"変更: {one[:120]}" if one else "変更: 差分あり（詳細は下の『差分』を参照）"
 
     # 3) 次アクション（理由は別欄で表示するので summary には入れない）
-    if imp in ("Breaking", "High"):
-        line3 = "次: 公式/原文を開いて影響（API/料金/規約/互換）を確認"
-    else:
-        line3 = "次: 必要なら公式/原文で一次情報を確認"
+    line3 = _NEXT_ACTION.get(imp, _NEXT_ACTION_DEFAULT)
 
     return first_n_lines("\n".join([line1, line2, line3]), 3)
 
 
-def main() -> None:
-    base_url = guess_base_url()
-    with open("state.json", "r", encoding="utf-8") as f:
-        state = json.load(f)
-
-    # state.json は通常 list だが、将来の形式変更に備えて dict も吸収する
-    if isinstance(state, dict):
-        for k in ("items", "history", "events", "entries"):
-            v = state.get(k)
-            if isinstance(v, list):
-                state = v
-                break
-        else:
-            state = []
-    elif not isinstance(state, list):
-        state = []
-
-    items = []
-    for it in (state or []):
-        if not isinstance(it, dict):
-            continue
-        impact = str(it.get("impact") or it.get("impact2") or "")
-        source = str(it.get("name") or it.get("source") or "")
-        url = str(it.get("url") or "")
-        title = str(it.get("title") or it.get("item_title") or "")
-        ts = str(it.get("ts") or it.get("time") or it.get("created") or it.get("created_at") or "")
-        snippet = str(it.get("snippet") or "")
-        snippet_full = str(
-            it.get("snippet_full")
-            or it.get("snippet_full_for_state")
-            or it.get("snippet_full_for_id")
-            or ""
-        )
-        # Insert robust diff_stats extraction
-        diff_stats = it.get("diff_stats")
-        if not isinstance(diff_stats, dict):
-            diff_stats = {}
-        if not diff_stats:
-            # tolerate alternate field names if they exist
-            diff_stats = {
-                "added": it.get("added") or it.get("diff_added") or it.get("plus") or 0,
-                "removed": it.get("removed") or it.get("diff_removed") or it.get("minus") or 0,
-                "churn": it.get("churn") or it.get("diff_churn") or 0,
-            }
-        reasons = it.get("reasons")
-        if isinstance(reasons, list):
-            reasons_s = " / ".join([str(x) for x in reasons if x])
-        else:
-            reasons_s = str(reasons or "")
-
-        # Japanese summary, 3-line normalization, fallback
-        summary = it.get("summary")
-        if not summary:
-            summary = it.get("summary_ja")
-        if not summary:
-            summary = it.get("summary3")
-        if not summary:
-            summary = it.get("summary_3")
-
-        # summary は3行に正規化（理由は別欄表示なので summary 側の「理由:」は除去）
-        summary_s = normalize_summary_text(str(summary or ""), reasons_s, 3)
-        if not summary_s:
-            summary_s = build_fallback_summary(source, impact, title, reasons_s, diff_stats, snippet_full, snippet)
-
-        items.append(
-            {
-                "impact": impact,
-                "source": source,
-                "url": url,
-                "title": title,
-                "ts": ts,
-                "ts_h": iso_to_human(ts),
-                "snippet": snippet,
-                "snippet_full": snippet_full,
-                "reasons": reasons_s,
-                "summary": summary_s,
-                "diff_stats": {
-                    "added": to_int((diff_stats or {}).get("added"), 0),
-                    "removed": to_int((diff_stats or {}).get("removed"), 0),
-                    "churn": to_int((diff_stats or {}).get("churn"), 0),
-                },
-            }
-        )
-
-    # 新しい順（ts 降順）
-    items.sort(key=lambda x: x.get("ts") or "", reverse=True)
-    sources = sorted({x.get("source") for x in items if x.get("source")})
-
-    def esc(s: str) -> str:
-        return html.escape(s or "", quote=True)
-
-    rows = []
-    for it in items:
-        title = it.get("title") or (it.get("snippet") or "").split("\n")[0] or "(no title)"
-        src = it.get("source") or ""
-        url = it.get("url") or ""
-        ts = it.get("ts_h") or it.get("ts") or ""
-        impact_txt = it.get("impact") or "—"
-        reasons = it.get("reasons") or ""
-        summary = it.get("summary") or ""
-        diff_body = it.get("snippet_full") or it.get("snippet") or ""
-
-        link_html = f'<a href="{esc(url)}" target="_blank" rel="noopener">公式/原文</a>' if url else ""
-        summary_html = (
-            f'<div class="small">要約: {esc(summary).replace("\n", "<br>")}</div>'
-            if summary
-            else ""
-        )
-        reasons_html = f'<div class="small">理由: {esc(reasons)}</div>' if reasons else ""
-        diff_html = f'<details><summary class="small">差分（snippet）</summary><pre class="mono">{esc(diff_body)}</pre></details>' if diff_body else ""
-
-        rows.append(
-            "\n".join(
-                [
-                    '<div class="row">',
-                    '  <div class="top">',
-                    f'    <div class="meta">{esc(ts)}<br><span class="badge" data-impact="{esc(impact_txt)}">{esc(impact_txt)}</span></div>',
-                    f'    <div class="meta">{esc(src)}</div>',
-                    '    <div>',
-                    f'      <p class="title">{esc(title)}</p>',
-                    f'      <div class="links small">{link_html}</div>',
-                    f'      {summary_html}' if summary_html else '',
-                    f'      {reasons_html}' if reasons_html else '',
-                    f'      {diff_html}' if diff_html else '',
-                    '    </div>',
-                    '  </div>',
-                    '</div>',
-                ]
-            )
-        )
-
-    rows_html = "\n".join([r for r in rows if r.strip()])
-    debug_static = f"debug_static: items={len(items)}, sources={len(sources)}"
-
-    data_json = json.dumps(
-        {"items": items, "sources": sources, "base_url": base_url}, ensure_ascii=False
-    )
-    # HTMLエスケープするとJSONが壊れて JSON.parse が落ちる。
-    # <script>内に埋めるので、終了タグだけ潰して安全化。
-    data_json_safe = data_json.replace("</", "<\\/")
-
-    # NOTE: f-string にすると JS の `${...}` と衝突するので、プレーン文字列 + 置換で埋め込む
-    out_html = """<!doctype html>
+# サーバ側描画の1行分。任意欄（要約/理由/差分）は空なら "" を渡す
+_ROW_TMPL = (
+    '<div class="row">\n'
+    '  <div class="top">\n'
+    '    <div class="meta">%s<br><span class="badge" data-impact="%s">%s</span></div>\n'
+    '    <div class="meta">%s</div>\n'
+    "    <div>\n"
+    '      <p class="title">%s</p>\n'
+    '      <div class="links small">%s</div>\n'
+    "%s%s%s"
+    "    </div>\n"
+    "  </div>\n"
+    "</div>"
+)
+_LINK_TMPL = '<a href="%s" target="_blank" rel="noopener">公式/原文</a>'
+_SUMMARY_TMPL = '      <div class="small">要約: %s</div>\n'
+_REASONS_TMPL = '      <div class="small">理由: %s</div>\n'
+_DIFF_TMPL = '      <details><summary class="small">差分（snippet）</summary><pre class="mono">%s</pre></details>\n'
+
+
+# NOTE: f-string にすると JS の `${...}` と衝突するので、プレーン文字列 + プレースホルダで埋め込む
+_TEMPLATE = """<!doctype html>
 <html lang="ja">
 <head>
   <meta charset="utf-8" />
@@ -431,8 +425,8 @@ def main() -> None:
 
     function match(it, q) {
       if (!q) return true;
-      const hay = ((it.title||'') + '\n' + (it.summary||'') + '\n' + (it.snippet||'') + '\n' + (it.snippet_full||'') + '\n' + (it.reasons||'')).toLowerCase();
-      return hay.includes(q);
+      // it.search は生成時に小文字化済みの検索対象（タイトル/要約/差分/理由）
+      return (it.search || '').includes(q);
     }
 
     function render() {
@@ -460,7 +454,7 @@ def main() -> None:
 
       const parts = [];
       for (const it of filtered) {
-        const title = it.title ? esc(it.title) : esc((it.snippet||'').split('\n')[0] || '(no title)');
+        const title = it.title ? esc(it.title) : esc((it.snippet||'').split('\\n')[0] || '(no title)');
         const src = esc(it.source || '');
         const url = esc(it.url || '');
         const ts = esc(it.ts_h || it.ts || '');
@@ -470,11 +464,11 @@ def main() -> None:
         if (summary) {
           // 古い生成物で summary に「理由:」が含まれている場合は除去（理由欄で別表示）
           summary = summary
-            .split(/\n/)
+            .split(/\\n/)
             .map(s => (s||'').trim())
             .filter(s => s && !s.startsWith('理由:'))
             .slice(0,3)
-            .join('\n');
+            .join('\\n');
         }
         const diffBody = it.snippet_full || it.snippet || '';
 
@@ -488,7 +482,7 @@ def main() -> None:
       <div class="links small">
         ${url ? `<a href="${url}" target="_blank" rel="noopener">公式/原文</a>` : ''}
       </div>
-      ${summary ? `<div class="small">要約: ${summary.replace(/\n/g,'<br>')}</div>` : ''}
+      ${summary ? `<div class="small">要約: ${summary.replace(/\\n/g,'<br>')}</div>` : ''}
       ${reasons ? `<div class="small">理由: ${reasons}</div>` : ''}
       ${diffBody ? `<details><summary class="small">差分（snippet）</summary><pre class="mono">${esc(diffBody)}</pre></details>` : ''}
     </div>
@@ -496,7 +490,7 @@ def main() -> None:
 </div>`);
       }
 
-      elList.innerHTML = parts.join('\n');
+      elList.innerHTML = parts.join('\\n');
       if (filtered.length === 0) {
         const tips = [];
         if (hideLow) tips.push('「Low を非表示」をOFFにすると表示される場合があります。');
@@ -519,12 +513,184 @@ def main() -> None:
 </html>
 """
 
-    out_html = out_html.replace("__DATA_JSON__", data_json_safe)
-    out_html = out_html.replace("__ROWS__", rows_html)
-    out_html = out_html.replace("__DEBUG_STATIC__", html.escape(debug_static, quote=True))
 
-    with open("changes.html", "w", encoding="utf-8") as f:
-        f.write(out_html)
+def _safe_json(obj) -> bytes:
+    """<script> 埋め込み用の JSON bytes。
+
+    HTMLエスケープするとJSONが壊れて JSON.parse が落ちる。
+    <script type="application/json"> を閉じ得るのは </script と <!-- だけなので、
+    その '<' だけを JSON 文字列として等価な \\u003c に置換する（該当なしなら素通し）。
+    """
+    b = _dumps(obj)
+    return _SCRIPT_BREAKOUT_RE.sub(rb"\\u003c", b) if b"<" in b else b
+
+
+def _write_data_json(f, items: list, sources: list, base_url: str) -> None:
+    """{"items": [...], "sources": [...], "base_url": "..."} を item 単位で書き出す。
+
+    全体を1つの bytes にしないので、巨大な state.json でもピークメモリが JSON 全体分増えない。
+    各断片は完結した JSON 値なので、</script の検査も断片ごとで漏れない。
+    """
+    f.write(b'{"items":[')
+    for i, it in enumerate(items):
+        if i:
+            f.write(b",")
+        f.write(_safe_json(it))
+    f.write(b'],"sources":')
+    f.write(_safe_json(sources))
+    f.write(b',"base_url":')
+    f.write(_safe_json(base_url))
+    f.write(b"}")
+
+
+def _split_template(tpl: str, *markers: str) -> list[str]:
+    """テンプレートをプレースホルダ位置で分割する（出現順に markers を並べること）。"""
+    out = []
+    for m in markers:
+        seg, tpl = tpl.split(m, 1)
+        out.append(seg)
+    out.append(tpl)
+    return out
+
+
+# import 時に一度だけ分割・エンコードしておき、main() では順に書き出すだけにする
+_TEMPLATE_PARTS = [
+    seg.encode("utf-8")
+    for seg in _split_template(_TEMPLATE, "__DEBUG_STATIC__", "__ROWS__", "__DATA_JSON__")
+]
+
+
+def main() -> None:
+    base_url = guess_base_url()
+    state = _load_json_file("state.json")
+
+    # state.json は通常 list だが、将来の形式変更に備えて dict も吸収する
+    if isinstance(state, dict):
+        for k in ("items", "history", "events", "entries"):
+            v = state.get(k)
+            if isinstance(v, list):
+                state = v
+                break
+        else:
+            state = []
+    elif not isinstance(state, list):
+        state = []
+
+    # 新しい順（ts 降順）。行の描画と JSON 用 dict の構築を1ループで済ませるため、
+    # 生の dict の段階で並べておく（安定ソートなので同時刻の順序も従来どおり）
+    records = [it for it in state if isinstance(it, dict)]
+    records.sort(key=_item_ts, reverse=True)
+
+    _escape = html.escape
+
+    def esc(s: str) -> str:
+        # 空文字はエスケープ不要（行ループ内で多数呼ばれるので分岐で短絡）
+        # NOTE: str.translate(maketrans({...})) による1パス化も試したが、複数文字への置換は
+        #       CPython では遅い経路になり、html.escape（C 実装の replace 5回）の約9倍かかった。
+        return _escape(s, True) if s else ""
+
+    items = []
+    sources_seen: dict[str, None] = {}
+    # 1行 = テンプレート1回の % 展開（行ごとの断片 list を作らない）
+    rows: list[str] = []
+    add = rows.append
+    for i, it in enumerate(records):
+        impact, source, url, title, ts, snippet, snippet_full, summary = [
+            _first_str(it, *aliases) for aliases in _STR_FIELD_ALIASES
+        ]
+        if source:
+            sources_seen[source] = None
+        ts_h = iso_to_human(ts)
+        # Insert robust diff_stats extraction（int 化は1回だけ行い、要約と JSON の両方で使う）
+        diff_stats = it.get("diff_stats")
+        if isinstance(diff_stats, dict) and diff_stats:
+            added_v, removed_v, churn_v = diff_stats.get("added"), diff_stats.get("removed"), diff_stats.get("churn")
+        else:
+            # tolerate alternate field names if they exist
+            added_v, removed_v, churn_v = [_first(it, *aliases, default=0) for _, aliases in _DIFF_STAT_ALIASES]
+        added = to_int(added_v, 0)
+        removed = to_int(removed_v, 0)
+        churn = to_int(churn_v, 0)
+        reasons = it.get("reasons")
+        if isinstance(reasons, list):
+            reasons_s = " / ".join([str(x) for x in reasons if x])
+        else:
+            reasons_s = str(reasons or "")
+
+        # summary は3行に正規化（理由は別欄表示なので summary 側の「理由:」は除去）
+        summary_s = normalize_summary_text(summary, reasons_s, 3)
+        if not summary_s:
+            summary_s = build_fallback_summary(
+                source,
+                impact,
+                title,
+                reasons_s,
+                added,
+                removed,
+                # churn 欠落時は要約側では +/- の合計で代用する（JSON 側は 0 のまま）
+                churn if churn_v is not None else added + removed,
+                snippet_full,
+                snippet,
+            )
+
+        items.append(
+            {
+                "impact": impact,
+                "source": source,
+                "url": url,
+                "title": title,
+                "ts": ts,
+                "ts_h": ts_h,
+                "snippet": snippet,
+                "snippet_full": snippet_full,
+                "reasons": reasons_s,
+                "summary": summary_s,
+                # クライアント検索用（キー入力ごとの連結・小文字化を避けるため生成時に1回だけ作る）
+                "search": "\n".join((title, summary_s, snippet, snippet_full, reasons_s)).lower(),
+                "diff_stats": {"added": added, "removed": removed, "churn": churn},
+            }
+        )
+
+        # サーバ側で描く行は JS 無効時のフォールバック用なので、先頭 STATIC_ROWS_LIMIT 件だけ
+        # （全件は埋め込み JSON にあり、JS の render() がフィルタ込みで描き直す）
+        # 埋め込み JSON は生の値のまま。クライアント側は自前で esc() する
+        if i >= STATIC_ROWS_LIMIT:
+            continue
+        impact_txt = esc(impact or "—")
+        diff_body = snippet_full or snippet
+        add(
+            _ROW_TMPL
+            % (
+                esc(ts_h or ts),
+                impact_txt,
+                impact_txt,
+                esc(source),
+                esc(title or snippet.split("\n")[0] or "(no title)"),
+                _LINK_TMPL % esc(url) if url else "",
+                _SUMMARY_TMPL % esc(summary_s).replace("\n", "<br>") if summary_s else "",
+                _REASONS_TMPL % esc(reasons_s) if reasons_s else "",
+                _DIFF_TMPL % esc(diff_body) if diff_body else "",
+            )
+        )
+
+    sources = sorted(sources_seen)
+    debug_static = f"debug_static: items={len(items)}, sources={len(sources)}"
+
+    head, mid_rows, mid_data, tail = _TEMPLATE_PARTS
+    # 巨大な1文字列を作って replace するのではなく、固定部と可変部を順に書き出す
+    # rows は debug_static（件数は全件処理後に確定）より後ろに出るので、
+    # STATIC_ROWS_LIMIT 件までは list に持ち、連結文字列は作らずに1行ずつ書く
+    with open("changes.html", "wb", buffering=1 << 20) as f:
+        f.write(head)
+        f.write(html.escape(debug_static, quote=True).encode("utf-8"))
+        f.write(mid_rows)
+        for i, row in enumerate(rows):
+            if i:
+                f.write(b"\n")
+            f.write(row.encode("utf-8"))
+        f.write(mid_data)
+        _write_data_json(f, items, sources, base_url)
+        f.write(tail)
 
     print("[SUMMARY] Wrote changes.html")
 
@@ -1,3 +1,6 @@
+import os
+
+
 def guess_base_url() -> str:
     """RSS の <channel><link> に使う base URL を決める。
 
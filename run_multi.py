@@ -5,13 +5,23 @@ import hashlib
 import uuid
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from difflib import unified_diff
+from itertools import islice
 import xml.etree.ElementTree as ET
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from openai import OpenAI
+
+try:
+    import orjson  # 任意依存（無ければ標準 json で動く）
+except ImportError:
+    orjson = None
+
 from targets import TARGETS
 
 from normalizers import normalize_rss_min, normalize_openapi_c14n_v1
@@ -30,6 +40,7 @@ SNAPSHOT_DIR = "snapshots"
 REPORTS_DIR = "reports"
 STATE_FILE = "state.json"
 MAX_ITEMS = 50  # RSSに残す履歴数（多すぎると読まれない）
+FETCH_WORKERS = 8  # 同時に取得するターゲット数の上限（I/O待ちを重ねるだけなので小さめで十分）
 
 # RSS/XML でノイズになりやすいメタデータ差分は無視（価値が低い通知を減らす）
 IGNORE_DIFF_SUBSTRINGS = [
@@ -42,15 +53,42 @@ IGNORE_DIFF_SUBSTRINGS = [
     "type=\"application/rss+xml\"",
 ]
 
+# 行ごとの照合用: 他の要素を部分文字列として含む要素（"<lastbuilddate>" 等）は判定結果を変えないので除く
+# （1本の正規表現 alternation より、C 実装の `in` を少数回すほうが速い）
+_IGNORE_DIFF_SCAN = tuple(
+    s for s in IGNORE_DIFF_SUBSTRINGS if not any(o != s and o in s for o in IGNORE_DIFF_SUBSTRINGS)
+)
+
+# 正規表現は呼び出しごとに re モジュールのキャッシュを引かないよう、ここで一度だけコンパイルする
+_SLUG_RE = re.compile(r"[^a-z0-9_\-]")
+
+# main: HTML かどうかの判定（raw.lower() で本文全体を複製せず、先頭付近で見つかればすぐ止まる）
+_HTML_SNIFF_RE = re.compile(r"<html|<!doctype html", re.IGNORECASE)
+
+# classify_impact（OpenAPI）: diff の +/- 行に現れる重要フィールド
+# 共通の先頭 `^[+-]\s*` をくくり出し、snippet を1回走査するだけで全フィールドを拾う
+# （先読みにして文字を消費しないので、行をまたぐマッチが次の行の判定を隠さない）
+_OPENAPI_FIELD_RE = re.compile(
+    r"^(?=[+-]\s*(?:"
+    r"(?P<version>version:\s*.+)"
+    r"|(?P<servers>servers:\s*)"
+    r"|(?P<security>security:\s*)"
+    r"|(?P<tag_name>-\s*name:\s*.+)"
+    r")$)",
+    re.MULTILINE,
+)
+_OPENAPI_FIELDS = frozenset(_OPENAPI_FIELD_RE.groupindex)
+
 
 def slugify(name: str) -> str:
     s = name.strip().lower()
     s = s.replace(" ", "_")
-    s = re.sub(r"[^a-z0-9_\-]", "", s)
+    s = _SLUG_RE.sub("", s)
     return s or "unnamed"
 
 
 def extract_text(html: str) -> str:
+    # 既存 snapshot はこのパーサ/get_text の出力なので、パーサを差し替えると誤検知の「変更あり」が出る
     soup = BeautifulSoup(html, "html.parser")
 
     # スクリプト・スタイル等はテキスト化のノイズになりやすいので除去
@@ -58,7 +96,11 @@ def extract_text(html: str) -> str:
         tag.decompose()
 
     text = soup.get_text(separator="\n")
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line:
+            lines.append(line)
     return "\n".join(lines)
 
 
@@ -160,69 +202,88 @@ def normalize_feed_xml(xml_text: str, max_items: int = 80) -> str:
     return xml_text
 
 
-def diff_snippet(old_text: str, new_text: str, max_lines: int = 40) -> str:
+def _iter_changed_lines(old_text: str, new_text: str):
+    """unified_diff の変更行（±）のうち、ノイズ差分を除いたものを順に返す。"""
+    # 完全一致（=毎回の実行で大半のターゲット）は difflib を回さずに打ち切る
+    if old_text == new_text:
+        return
+
     old_lines = old_text.splitlines(keepends=False)
     new_lines = new_text.splitlines(keepends=False)
 
-    diff = unified_diff(old_lines, new_lines, lineterm="")
-    snippet_lines = []
+    # 先頭・末尾の共通行を削ってから渡すことはしない: SequenceMatcher は全体から最長一致を探すので、
+    # 削ると±行の並びや件数が変わることがある（item_id・大量更新の判定がずれる）
+
+    # 文脈行はどうせ捨てるので n=0 で生成させない（±行の並びは n=3 と同じ）
+    diff = unified_diff(old_lines, new_lines, lineterm="", n=0)
     for line in diff:
-        # ヘッダは除外
-        if line.startswith(("---", "+++", "@@")):
+        # 変更行のみ収集（±）。"@@" ヘッダは先頭1文字で、"---"/"+++" ヘッダと "--"/"++" 行は2文字目で落ちる
+        c0 = line[:1]
+        if c0 != "+" and c0 != "-":
             continue
-        # 変更行のみ収集（±）
-        if line.startswith(("-", "+")) and not line.startswith(("--", "++")):
-            # ノイズ差分は落とす（lastBuildDate等）
-            low = line.lower()
-            if any(s in low for s in IGNORE_DIFF_SUBSTRINGS):
-                continue
-            # 長すぎる行は切る
-            snippet_lines.append(line[:200])
-        if len(snippet_lines) >= max_lines:
-            break
+        if line[1:2] == c0:
+            continue
+        # ノイズ差分は落とす（lastBuildDate等）
+        low = line.lower()
+        if any(s in low for s in _IGNORE_DIFF_SCAN):
+            continue
+        yield line
+
 
-    return "\n".join(snippet_lines).strip()
+def diff_snippet(old_text: str, new_text: str, max_lines: int = 40) -> str:
+    # max_lines 行に達したら diff の生成自体を打ち切る（長すぎる行は切る）
+    changed = _iter_changed_lines(old_text, new_text)
+    return "\n".join(line[:200] for line in islice(changed, max_lines)).strip()
 
 def diff_stats(old_text: str, new_text: str) -> dict:
     """diff_snippet と同じフィルタ方針で、追加/削除行数を集計する。"""
-    old_lines = old_text.splitlines(keepends=False)
-    new_lines = new_text.splitlines(keepends=False)
-
     added = 0
     removed = 0
 
-    diff = unified_diff(old_lines, new_lines, lineterm="")
-    for line in diff:
-        # ヘッダは除外
-        if line.startswith(("---", "+++", "@@")):
-            continue
-        if line.startswith(("-", "+")) and not line.startswith(("--", "++")):
-            low = line.lower()
-            if any(s in low for s in IGNORE_DIFF_SUBSTRINGS):
-                continue
-            if line.startswith("+"):
-                added += 1
-            elif line.startswith("-"):
-                removed += 1
+    for line in _iter_changed_lines(old_text, new_text):
+        if line.startswith("+"):
+            added += 1
+        else:
+            removed += 1
 
     return {"added": added, "removed": removed, "churn": added + removed}
 
 
+def diff_snippet_with_stats(old_text: str, new_text: str, max_lines: int = 40) -> tuple[str, dict]:
+    """diff_snippet と diff_stats を、unified_diff 1回分の走査でまとめて求める。"""
+    snippet_lines = []
+    added = 0
+    removed = 0
+
+    for line in _iter_changed_lines(old_text, new_text):
+        if len(snippet_lines) < max_lines:
+            snippet_lines.append(line[:200])
+        if line.startswith("+"):
+            added += 1
+        else:
+            removed += 1
+
+    snippet = "\n".join(snippet_lines).strip()
+    return snippet, {"added": added, "removed": removed, "churn": added + removed}
+
+
 def snippet_stats(snippet: str) -> dict:
     """snippet（+/-行）から、追加/削除/総量(churn)を集計する。"""
     added = 0
     removed = 0
     for line in (snippet or "").splitlines():
-        if not line:
+        c0 = line[:1]
+        if c0 != "+" and c0 != "-":
             continue
-        if line.startswith(("+", "-")) and not line.startswith(("++", "--")):
-            low = line.lower()
-            if any(s in low for s in IGNORE_DIFF_SUBSTRINGS):
-                continue
-            if line.startswith("+"):
-                added += 1
-            elif line.startswith("-"):
-                removed += 1
+        if line[1:2] == c0:
+            continue
+        low = line.lower()
+        if any(s in low for s in _IGNORE_DIFF_SCAN):
+            continue
+        if c0 == "+":
+            added += 1
+        else:
+            removed += 1
     return {"added": added, "removed": removed, "churn": added + removed}
 
 
@@ -269,6 +330,40 @@ def compact_news_snippet(snippet: str, max_lines: int = 12, prefer_keywords: lis
 
     return "\n".join(picked[:max_lines]).strip()
 
+# classify_impact のキーワード（snippet は小文字化済み）。呼び出しごとにリストを作り直さないようここで定義する。
+# 1つの正規表現の alternation にまとめるより、C 実装の `in` を順に回すほうが速い（re はリテラル集合の同時照合をしない）
+# Changelog: 破壊的/移行必須/提供終了系
+_CHANGELOG_BREAKING_KW = (
+    "breaking",
+    "deprecat",
+    "removed",
+    "remove ",
+    "will be removed",
+    "sunset",
+    "sunsetting",
+    "migration",
+    "end of life",
+    "eol",
+)
+# Changelog: セキュリティ・認証・権限
+_CHANGELOG_SECURITY_KW = ("security", "auth", "authentication", "authorization", "permission", "scope", "policy")
+# Changelog: 価格・課金・制限（運用影響が出やすい）
+_CHANGELOG_PRICING_KW = ("pricing", "price", "billing", "quota", "rate limit", "limit")
+# News: 規約/安全/料金などの高シグナル
+_NEWS_HIGH_KW = (
+    "policy",
+    "terms",
+    "pricing",
+    "price",
+    "billing",
+    "security",
+    "compliance",
+    "privacy",
+    "trust",
+    "safety",
+)
+
+
 def classify_impact(name: str, url: str, snippet: str, default_impact: str):
     """重要度の自動判定（MVP: 方針2=ノイズ最小優先）
 
@@ -288,8 +383,14 @@ def classify_impact(name: str, url: str, snippet: str, default_impact: str):
     # --- OpenAPI (YAML) ---
     is_openapi = ("openapi" in n) or u.endswith((".yml", ".yaml"))
     if is_openapi:
+        fields = set()
+        for m in _OPENAPI_FIELD_RE.finditer(snippet):
+            fields.add(m.lastgroup)
+            if len(fields) == len(_OPENAPI_FIELDS):
+                break
+
         # 重要フィールドの変更は強いシグナル
-        if re.search(r"^[+-]\s*version:\s*.+$", snippet, flags=re.MULTILINE):
+        if "version" in fields:
             score += 60
             reasons.append("OpenAPI: version変更")
 
@@ -298,17 +399,17 @@ def classify_impact(name: str, url: str, snippet: str, default_impact: str):
             reasons.append("OpenAPI: termsOfService変更")
 
         # servers / base url
-        if re.search(r"^[+-]\s*servers:\s*$", snippet, flags=re.MULTILINE) or "https://api.openai.com" in s:
+        if "servers" in fields or "https://api.openai.com" in s:
             score += 40
             reasons.append("OpenAPI: servers.url変更")
 
         # security scheme / auth
-        if re.search(r"^[+-]\s*security:\s*$", snippet, flags=re.MULTILINE) or "apikeyauth" in s:
+        if "security" in fields or "apikeyauth" in s:
             score += 40
             reasons.append("OpenAPI: security変更")
 
         # tags の増減は軽微扱い（MVP: 方針2=ノイズ最小のため加点しない）
-        if re.search(r"^[+-]\s*-\s*name:\s*.+$", snippet, flags=re.MULTILINE):
+        if "tag_name" in fields:
             score += 0
             reasons.append("OpenAPI: tags増減（軽微）")
 
@@ -325,31 +426,17 @@ def classify_impact(name: str, url: str, snippet: str, default_impact: str):
     is_changelog = "changelog" in n
     if is_changelog:
         # 破壊的/移行必須/提供終了系
-        breaking_kw = [
-            "breaking",
-            "deprecat",
-            "removed",
-            "remove ",
-            "will be removed",
-            "sunset",
-            "sunsetting",
-            "migration",
-            "end of life",
-            "eol",
-        ]
-        if any(k in s for k in breaking_kw):
+        if any(k in s for k in _CHANGELOG_BREAKING_KW):
             score += 80
             reasons.append("Changelog: breaking/deprecate/removed")
 
         # セキュリティ・認証・権限
-        sec_kw = ["security", "auth", "authentication", "authorization", "permission", "scope", "policy"]
-        if any(k in s for k in sec_kw):
+        if any(k in s for k in _CHANGELOG_SECURITY_KW):
             score += 30
             reasons.append("Changelog: security/auth/policy")
 
         # 価格・課金・制限（運用影響が出やすい）
-        price_kw = ["pricing", "price", "billing", "quota", "rate limit", "limit"]
-        if any(k in s for k in price_kw):
+        if any(k in s for k in _CHANGELOG_PRICING_KW):
             score += 30
             reasons.append("Changelog: pricing/quota")
 
@@ -371,26 +458,19 @@ def classify_impact(name: str, url: str, snippet: str, default_impact: str):
     is_news = "news" in n
     if is_news:
         # ニュースは一般にMediumだが、規約/安全/料金などはHigh候補
-        high_kw = [
-            "policy",
-            "terms",
-            "pricing",
-            "price",
-            "billing",
-            "security",
-            "compliance",
-            "privacy",
-            "trust",
-            "safety",
-        ]
-
-        has_high_signal = any(k in s for k in high_kw)
+        has_high_signal = any(k in s for k in _NEWS_HIGH_KW)
         if has_high_signal:
             score += 50
             reasons.append("News: policy/terms/pricing/security")
 
-        removed_lines = sum(1 for ln in (snippet or "").splitlines() if ln.startswith("-"))
-        added_lines = sum(1 for ln in (snippet or "").splitlines() if ln.startswith("+"))
+        removed_lines = 0
+        added_lines = 0
+        for ln in (snippet or "").splitlines():
+            c0 = ln[:1]
+            if c0 == "-":
+                removed_lines += 1
+            elif c0 == "+":
+                added_lines += 1
         churn = removed_lines + added_lines
 
         # 高シグナルがある上で大量更新なら、重要だが確認コストも高い（理由として明示）
@@ -834,19 +914,30 @@ def run_selftests(verbose: bool = False) -> bool:
     return ok
 
 
-def summarize_ja_3lines(name: str, url: str, snippet: str, impact: str) -> str:
-    """日本語3行要約（炎上しない設計）
+# OpenAI クライアントは API キーごとに1つだけ作って使い回す（HTTP 接続プールを共有する）
+_OPENAI_CLIENTS: dict[str, OpenAI] = {}
+
+
+def _openai_client(api_key: str) -> OpenAI:
+    client = _OPENAI_CLIENTS.get(api_key)
+    if client is None:
+        client = _OPENAI_CLIENTS[api_key] = OpenAI(api_key=api_key)
+    return client
+
+
+def summarize_ja_3lines(name: str, url: str, snippet: str, impact: str) -> tuple[str, str]:
+    """日本語3行要約（炎上しない設計）して (要約, [HEALTH] 行) を返す
     - 断定しない（「〜の可能性」「〜のように見える」）
     - 推測や外部知識を入れない（差分から読める範囲のみ）
     - 失敗しても運用を止めない（空文字で返す）
+    - [HEALTH] 行は print せずに返す（スレッドプールから呼ばれるので、ログ行が混ざらないよう main スレッドで出す）
     """
     api_key = os.getenv("OPENAI_API_KEY", "").strip()
     if not api_key:
-        print(f'[HEALTH] SKIP name="{name}" stage=summarize reason="empty"')
-        return ""
+        return "", f'[HEALTH] SKIP name="{name}" stage=summarize reason="empty"'
 
     try:
-        client = OpenAI(api_key=api_key)
+        client = _openai_client(api_key)
 
         prompt = f"""あなたはプロダクト責任者向けの変更監視アシスタントです。
 以下の差分（+/-行）だけから、日本語で『必ず3行』要約してください。
@@ -889,29 +980,48 @@ def summarize_ja_3lines(name: str, url: str, snippet: str, impact: str) -> str:
 
         text = (text or "").strip()
         if not text:
-            return ""
+            return "", ""
 
         # 保険：必ず3行に整形（ただし断定しない文面に寄せる）
         lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
         lines = lines[:3]
         while len(lines) < 3:
             lines.append("差分のみ要確認のように見える")
-        return "\n".join(lines)
+        return "\n".join(lines), ""
 
     except Exception as e:
         err_str = str(e).splitlines()[0][:60].replace('"', "'")
-        print(f'[HEALTH] FAIL name="{name}" stage=summarize error="{err_str}"')
-        return ""
+        return "", f'[HEALTH] FAIL name="{name}" stage=summarize error="{err_str}"'
+
 
+_RFC822_DOW = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_RFC822_MON = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
 
-def utc_now_rfc822() -> str:
-    # RSS向け
-    return datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+def format_rfc822(dt: datetime) -> str:
+    """UTC の datetime を RFC-822 形式へ（RSS向け。strftime を使わないのでロケール非依存）。"""
+    return "%s, %02d %s %04d %02d:%02d:%02d GMT" % (
+        _RFC822_DOW[dt.weekday()],
+        dt.day,
+        _RFC822_MON[dt.month - 1],
+        dt.year,
+        dt.hour,
+        dt.minute,
+        dt.second,
+    )
 
 
 def load_state() -> list:
     if not os.path.exists(STATE_FILE):
         return []
+    if orjson is not None:
+        try:
+            with open(STATE_FILE, "rb") as f:
+                return orjson.loads(f.read())
+        except Exception:
+            # orjson は標準 json が読める入力（NaN 等）を拒否するので、空扱いにせず標準 json で読み直す
+            # （空で返すと save_state が履歴を空で上書きしてしまう）
+            pass
     try:
         with open(STATE_FILE, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -920,13 +1030,21 @@ def load_state() -> list:
 
 
 def save_state(items: list) -> None:
+    # orjson の OPT_INDENT_2 は json.dump(ensure_ascii=False, indent=2) とバイト単位で同じ出力になる
+    if orjson is not None:
+        with open(STATE_FILE, "wb") as f:
+            f.write(orjson.dumps(items, option=orjson.OPT_INDENT_2))
+        return
     with open(STATE_FILE, "w", encoding="utf-8") as f:
         json.dump(items, f, ensure_ascii=False, indent=2)
 
 
 def make_item_id(url: str, snippet: str) -> str:
     h = hashlib.sha1()
-    h.update((url + "\n" + snippet).encode("utf-8"))
+    # url + "\n" + snippet を連結せずに順に流し込む（ダイジェストは連結版と同一）
+    h.update(url.encode("utf-8"))
+    h.update(b"\n")
+    h.update(snippet.encode("utf-8"))
     return h.hexdigest()
 
 
@@ -935,17 +1053,100 @@ def ensure_dir(path: str) -> None:
         os.makedirs(path, exist_ok=True)
 
 
-def fetch(url: str) -> str:
+# 一時的な失敗（接続エラー / 429 / 5xx）は指数バックオフで数回だけ再試行する（urllib3 2.x では 0s, 1s, 2s 待つ）
+# 上限に達したら最後のレスポンスを返し、raise_for_status() で従来どおりの取得失敗として扱う
+# Retry-After は無視する（サーバ指定の長い待機で実行全体が止まらないよう、待ちはバックオフの上限に収める）
+_FETCH_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+
+# 全ターゲットで接続プールを共有する（同一ホストへの再接続・TLSハンドシェイクを省く）
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=_FETCH_RETRY)
+)
+_SESSION.mount(
+    "http://", HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=FETCH_WORKERS, max_retries=_FETCH_RETRY)
+)
+
+
+def load_http_validators(path: str) -> dict:
+    """前回取得時の ETag / Last-Modified / 生レスポンスの SHA-256（snapshot の隣の .http.json）を読む。無ければ空。"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_http_validators(path: str, validators: dict) -> None:
+    """ETag / Last-Modified / raw_sha256 を保存する（値が変わらなければ書き換えず、git の差分を増やさない）。"""
+    if validators == load_http_validators(path):
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(validators, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def write_snapshot(snap_file: str, text: str, http_file: str, validators: dict) -> None:
+    """snapshot を書き、その本文を返した取得の validators も一緒に保存する。
+
+    validators は snapshot を書き換えるときにだけ更新する。
+    （変更なしの日に ETag の付け替え等だけで追跡ファイルが変わり、ノイズのコミットが出るのを防ぐ）
+    """
+    with open(snap_file, "w", encoding="utf-8") as f:
+        f.write(text)
+    save_http_validators(http_file, validators)
+
+
+def fetch(url: str, validators: dict | None = None) -> tuple[str | None, dict]:
+    """URL を取得して (本文, 次回用の validators) を返す。
+
+    validators（etag / last_modified）があれば条件付き GET を送り、
+    304 Not Modified のときは本文を None で返す（呼び出し側は diff を丸ごと省略できる）。
+    """
     headers = {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
         "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
+        # no-cache は「中間キャッシュを使わずオリジンで再検証せよ」の意味なので、条件付き GET とも両立する
         "Cache-Control": "no-cache",
         "Pragma": "no-cache",
     }
-    r = requests.get(url, headers=headers, timeout=30, allow_redirects=True)
+    validators = validators or {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    r = _SESSION.get(url, headers=headers, timeout=30, allow_redirects=True)
+    if r.status_code == 304:
+        return None, validators
     r.raise_for_status()
-    return r.text
+
+    new_validators = {}
+    if r.headers.get("ETag"):
+        new_validators["etag"] = r.headers["ETag"]
+    if r.headers.get("Last-Modified"):
+        new_validators["last_modified"] = r.headers["Last-Modified"]
+    return r.text, new_validators
+
+
+def _fetch_or_error(url: str, validators: dict) -> tuple[str | None, dict, Exception | None]:
+    """スレッドプール用: 例外は投げずに返し、main 側の従来の except で扱えるようにする。"""
+    try:
+        text, new_validators = fetch(url, validators)
+        return text, new_validators, None
+    except Exception as e:
+        return None, validators, e
 
 
 def _extract_entries_from_snippet(snippet: str) -> list[tuple[str, str]]:
@@ -1070,7 +1271,10 @@ def generate_markdown_report(new_items: list, run_at: str) -> None:
 
 def main(log_diff_stats: bool = False):
     ensure_dir(SNAPSHOT_DIR)
-    run_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    now = datetime.now(timezone.utc)
+    run_at = now.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # 1実行の item は同じ pubDate を共有する（item ごとに時刻を整形し直さない）
+    pub_date = format_rfc822(now)
     run_id = uuid.uuid4().hex  # 32桁 hex、1実行で1つ生成
     new_items: list = []
 
@@ -1085,172 +1289,225 @@ def main(log_diff_stats: bool = False):
     suppressed_total = 0
     suppressed_by_type = {"window_drop": 0, "bulk_update": 0, "other": 0}
 
-    for t in TARGETS:
-        name = t["name"]
-        url = t["url"]
-        impact = t["impact"]
+    # snapshots/ の一覧は1回の scandir で取り、ターゲットごとに stat() しない
+    existing_snapshots = {e.name for e in os.scandir(SNAPSHOT_DIR)}
+    slugs = [slugify(t["name"]) for t in TARGETS]
 
-        snap_file = os.path.join(SNAPSHOT_DIR, f"{slugify(name)}.txt")
+    # snapshot がある対象だけ条件付き GET にする（snapshot が無ければ本文が必要）
+    validators_list = []
+    for slug in slugs:
+        if f"{slug}.txt" in existing_snapshots and f"{slug}.http.json" in existing_snapshots:
+            validators_list.append(load_http_validators(os.path.join(SNAPSHOT_DIR, f"{slug}.http.json")))
+        else:
+            validators_list.append({})
+
+    # 取得（ネットワーク待ち）だけを並列化し、diff/snapshot/state の更新は従来どおり TARGETS 順に逐次で行う
+    # （ex.map は投入順に結果を返すので、state に積まれる item の順序は変わらない）
+    # 例外でループを抜けても with でプールを閉じる（取得・要約のスレッドを残さない）
+    with ThreadPoolExecutor(max_workers=max(1, min(FETCH_WORKERS, len(TARGETS)))) as pool:
+        fetched = pool.map(_fetch_or_error, [t["url"] for t in TARGETS], validators_list)
+        pending_summaries: list = []  # (new_items の添字, 要約の Future)
+
+        for t, slug, prev_validators, (fetched_raw, fetched_validators, fetch_error) in zip(
+            TARGETS, slugs, validators_list, fetched
+        ):
+            name = t["name"]
+            url = t["url"]
+            impact = t["impact"]
+
+            snap_file = os.path.join(SNAPSHOT_DIR, f"{slug}.txt")
+            http_file = os.path.join(SNAPSHOT_DIR, f"{slug}.http.json")
+
+            # 304 Not Modified: 本文が前回から変わっていないので正規化・diff ごと省略する
+            if fetch_error is None and fetched_raw is None:
+                print(f'[HEALTH] OK name="{name}" stage=fetch')
+                if log_diff_stats:
+                    print(f"[{impact}] {name} : 変更なし (+0/-0, churn=0, 304)")
+                else:
+                    print(f"[{impact}] {name} : 変更なし (304)")
+                continue
 
-        old_text = ""
-        if os.path.exists(snap_file):
-            with open(snap_file, "r", encoding="utf-8") as f:
-                old_text = f.read()
+            # 200 でも生レスポンスが snapshot を作った本文と同一なら、パース・正規化・diff ごと省略する（ETag を返さないサーバ向け）
+            # raw_sha256 は write_snapshot で .txt と一緒にしか保存しない（変化なしの日に追跡ファイルを変えない）
+            if fetch_error is None:
+                raw_sha256 = hashlib.sha256(fetched_raw.encode("utf-8")).hexdigest()
+                fetched_validators = {**fetched_validators, "raw_sha256": raw_sha256}
+                if raw_sha256 == prev_validators.get("raw_sha256"):
+                    print(f'[HEALTH] OK name="{name}" stage=fetch')
+                    if log_diff_stats:
+                        print(f"[{impact}] {name} : 変更なし (+0/-0, churn=0, raw一致)")
+                    else:
+                        print(f"[{impact}] {name} : 変更なし (raw一致)")
+                    continue
 
-        try:
-            raw = fetch(url)
-
-            # 1) targets.py の normalize 指定があれば最優先で適用
-            new_text = None
-            norm_key = t.get("normalize")
-            if norm_key:
-                fn = NORMALIZERS.get(norm_key)
-                if fn:
-                    try:
-                        new_text = fn(raw)
-                    except Exception as e:
-                        if os.getenv("DEBUG_NORMALIZE", "") in ("1", "true", "TRUE"):
-                            print(f"[WARN] normalize failed: {name} ({norm_key}) -> {e}")
-                        new_text = None
-
-            # 2) normalize 指定が無い / 失敗した場合は従来ロジックでフォールバック
-            if new_text is None:
-                # XMLはRSS/Atomなら『エントリ一覧』に正規化して比較（巨大diffのノイズ削減）
-                if url.endswith(".xml"):
-                    new_text = normalize_feed_xml(raw, max_items=80)
-
-                # YAMLはそのまま（正規化は行末処理で最低限）
-                elif url.endswith((".yml", ".yaml")):
-                    new_text = raw
+            old_text = ""
+            if f"{slug}.txt" in existing_snapshots:
+                with open(snap_file, "r", encoding="utf-8") as f:
+                    old_text = f.read()
 
-                else:
-                    # HTMLっぽい場合だけテキスト抽出
-                    if "<html" in raw.lower() or "<!doctype html" in raw.lower():
-                        new_text = extract_text(raw)
-                    else:
+            try:
+                if fetch_error is not None:
+                    raise fetch_error
+                raw = fetched_raw
+
+                # 1) targets.py の normalize 指定があれば最優先で適用
+                new_text = None
+                norm_key = t.get("normalize")
+                if norm_key:
+                    fn = NORMALIZERS.get(norm_key)
+                    if fn:
+                        try:
+                            new_text = fn(raw)
+                        except Exception as e:
+                            if os.getenv("DEBUG_NORMALIZE", "") in ("1", "true", "TRUE"):
+                                print(f"[WARN] normalize failed: {name} ({norm_key}) -> {e}")
+                            new_text = None
+
+                # 2) normalize 指定が無い / 失敗した場合は従来ロジックでフォールバック
+                if new_text is None:
+                    # XMLはRSS/Atomなら『エントリ一覧』に正規化して比較（巨大diffのノイズ削減）
+                    if url.endswith(".xml"):
+                        new_text = normalize_feed_xml(raw, max_items=80)
+
+                    # YAMLはそのまま（正規化は行末処理で最低限）
+                    elif url.endswith((".yml", ".yaml")):
                         new_text = raw
 
-            # 全形式共通の正規化（CRLF→LF + 行末空白除去）
-            new_text = "\n".join(line.rstrip() for line in new_text.replace("\r\n", "\n").splitlines())
-
-        except Exception as e:
-            err_str = str(e).splitlines()[0][:60].replace('"', "'")
-            print(f'[HEALTH] FAIL name="{name}" stage=fetch error="{err_str}"')
-            print(f"[{impact}] {name} : 取得失敗（今回はスキップ） -> {e}")
-            continue
+                    else:
+                        # HTMLっぽい場合だけテキスト抽出
+                        if _HTML_SNIFF_RE.search(raw):
+                            new_text = extract_text(raw)
+                        else:
+                            new_text = raw
+
+                # 全形式共通の正規化（CRLF→LF + 行末空白除去）
+                # join はどのみち一度リスト化するので、ジェネレータではなくリスト内包で渡す
+                new_text = "\n".join([line.rstrip() for line in new_text.replace("\r\n", "\n").splitlines()])
+
+            except Exception as e:
+                err_str = str(e).splitlines()[0][:60].replace('"', "'")
+                print(f'[HEALTH] FAIL name="{name}" stage=fetch error="{err_str}"')
+                print(f"[{impact}] {name} : 取得失敗（今回はスキップ） -> {e}")
+                continue
 
-        print(f'[HEALTH] OK name="{name}" stage=fetch')
-        if not old_text:
-            # 初回は比較対象が無いので、スナップショットだけ保存して終了
-            with open(snap_file, "w", encoding="utf-8") as f:
-                f.write(new_text)
-            print(f"[{impact}] {name} : 初回")
-            continue
+            print(f'[HEALTH] OK name="{name}" stage=fetch')
+            if not old_text:
+                # 初回は比較対象が無いので、スナップショットだけ保存して終了
+                write_snapshot(snap_file, new_text, http_file, fetched_validators)
+                print(f"[{impact}] {name} : 初回")
+                continue
 
-        snippet = diff_snippet(old_text, new_text)
-        # 変更なし（=diff_snippet が空）なら、スナップショットも state も更新しない
-        if not snippet:
-            if log_diff_stats:
-                print(f"[{impact}] {name} : 変更なし (+0/-0, churn=0)")
-            else:
-                print(f"[{impact}] {name} : 変更なし")
-            continue
+            snippet, stats_for_state = diff_snippet_with_stats(old_text, new_text)
+            # 変更なし（=diff_snippet が空）なら、スナップショットも state も更新しない
+            if not snippet:
+                # .http.json がまだ無い既存ターゲットは、ここで一度だけ作る（無いままだと条件付き GET も raw 一致の省略も始まらない）
+                if f"{slug}.http.json" not in existing_snapshots:
+                    save_http_validators(http_file, fetched_validators)
+                if log_diff_stats:
+                    print(f"[{impact}] {name} : 変更なし (+0/-0, churn=0)")
+                else:
+                    print(f"[{impact}] {name} : 変更なし")
+                continue
 
-        # ここから先は「変更あり」
-        # state.json には常に diff 統計を保存する（ログ出力有無と独立）
-        stats_for_state = diff_stats(old_text, new_text)
+            # ここから先は「変更あり」
+            # state.json には常に diff 統計を保存する（ログ出力有無と独立）
+            # （stats_for_state は diff_snippet_with_stats で snippet と同時に求めている）
+
+            # item_id は「圧縮前の完全な diff snippet」で固定（圧縮ルール変更で重複itemが増えないようにする）
+            raw_snippet = snippet
+            snippet_full_for_state = ""
+
+            # News は大量入替が起きやすいので、excerpt を短くして可読性を最優先する
+            if "news" in (name or "").lower() and stats_for_state.get("churn", 0) >= 20:
+                snippet = compact_news_snippet(
+                    snippet,
+                    max_lines=12,
+                    prefer_keywords=[
+                        "policy",
+                        "terms",
+                        "termsofservice",
+                        "pricing",
+                        "billing",
+                        "security",
+                        "privacy",
+                        "trust",
+                        "safety",
+                    ],
+                )
+                snippet_full_for_state = raw_snippet
+
+            impact2, score, reasons = classify_impact(name, url, snippet, impact)
+            # 「通知抑制」扱いの Low は RSS/履歴には載せないが、snapshotは更新して同じノイズが繰り返し出ないようにする
+            if impact2 == "Low" and any("通知抑制" in r for r in (reasons or [])):
+                # snapshot は更新（次回以降の差分をクリーンにする）
+                write_snapshot(snap_file, new_text, http_file, fetched_validators)
+
+                suppressed_total += 1
+                rs = " ".join(reasons or [])
+                if "ウィンドウ更新" in rs:
+                    sup_kind = "window_drop"
+                    suppressed_by_type[sup_kind] += 1
+                elif "大量更新" in rs:
+                    sup_kind = "bulk_update"
+                    suppressed_by_type[sup_kind] += 1
+                else:
+                    sup_kind = "other"
+                    suppressed_by_type[sup_kind] += 1
 
-        # item_id は「圧縮前の完全な diff snippet」で固定（圧縮ルール変更で重複itemが増えないようにする）
-        raw_snippet = snippet
-        snippet_full_for_state = ""
+                if log_diff_stats:
+                    print(f"[SUPPRESS] {name} : {sup_kind} (+{stats_for_state['added']}/-{stats_for_state['removed']}, churn={stats_for_state['churn']})")
+                else:
+                    print(f"[SUPPRESS] {name} : {sup_kind}")
+                continue
 
-        # News は大量入替が起きやすいので、excerpt を短くして可読性を最優先する
-        if "news" in (name or "").lower() and stats_for_state.get("churn", 0) >= 20:
-            snippet = compact_news_snippet(
-                snippet,
-                max_lines=12,
-                prefer_keywords=[
-                    "policy",
-                    "terms",
-                    "termsofservice",
-                    "pricing",
-                    "billing",
-                    "security",
-                    "privacy",
-                    "trust",
-                    "safety",
-                ],
-            )
-            snippet_full_for_state = raw_snippet
-
-        impact2, score, reasons = classify_impact(name, url, snippet, impact)
-        # 「通知抑制」扱いの Low は RSS/履歴には載せないが、snapshotは更新して同じノイズが繰り返し出ないようにする
-        if impact2 == "Low" and any("通知抑制" in r for r in (reasons or [])):
-            # snapshot は更新（次回以降の差分をクリーンにする）
-            with open(snap_file, "w", encoding="utf-8") as f:
-                f.write(new_text)
-
-            suppressed_total += 1
-            rs = " ".join(reasons or [])
-            if "ウィンドウ更新" in rs:
-                sup_kind = "window_drop"
-                suppressed_by_type[sup_kind] += 1
-            elif "大量更新" in rs:
-                sup_kind = "bulk_update"
-                suppressed_by_type[sup_kind] += 1
-            else:
-                sup_kind = "other"
-                suppressed_by_type[sup_kind] += 1
+            # ここまで来たら「採用する変更」なので snapshot を更新（変更なし/通知抑制では汚さない）
+            write_snapshot(snap_file, new_text, http_file, fetched_validators)
+
+            item_id = make_item_id(url, raw_snippet)
+            if item_id not in existing_ids:
+                # Important（Breaking/High）の変更だけ日本語3行要約（API失敗時は空で継続）
+                # 要約は API 待ちなので pool に投げ、残りのターゲットの処理と重ねる（結果はループ後に埋める）
+                if impact2 in ("Breaking", "High"):
+                    pending_summaries.append((len(new_items), pool.submit(summarize_ja_3lines, name, url, snippet, impact2)))
+
+                state.insert(
+                    0,
+                    {
+                        "id": item_id,
+                        "impact": impact2,
+                        "name": name,
+                        "url": url,
+                        "snippet": snippet,
+                        "snippet_full": snippet_full_for_state,
+                        "diff": stats_for_state,
+                        "score": score,
+                        "reasons": reasons,
+                        "summary_ja": "",
+                        "pubDate": pub_date,
+                        "run_at": run_at,
+                        "run_id": run_id,
+                    },
+                )
+                existing_ids.add(item_id)
+                new_items.append(state[0])
+                added_total += 1
+                if impact2 in added_by_impact:
+                    added_by_impact[impact2] += 1
 
             if log_diff_stats:
-                print(f"[SUPPRESS] {name} : {sup_kind} (+{stats_for_state['added']}/-{stats_for_state['removed']}, churn={stats_for_state['churn']})")
+                print(
+                    f"[{impact2}] {name} : 変更あり (score={score}, +{stats_for_state['added']}/-{stats_for_state['removed']}, churn={stats_for_state['churn']})"
+                )
             else:
-                print(f"[SUPPRESS] {name} : {sup_kind}")
-            continue
-
-        # ここまで来たら「採用する変更」なので snapshot を更新（変更なし/通知抑制では汚さない）
-        with open(snap_file, "w", encoding="utf-8") as f:
-            f.write(new_text)
-
-        # Important（Breaking/High）の変更だけ日本語3行要約（API失敗時は空で継続）
-        summary_ja = ""
-        if impact2 in ("Breaking", "High"):
-            summary_ja = summarize_ja_3lines(name, url, snippet, impact2)
-            if not summary_ja:
-                print(f"[{impact2}] {name} : 要約生成に失敗（空のまま継続）")
-
-        item_id = make_item_id(url, raw_snippet)
-        if item_id not in existing_ids:
-            state.insert(
-                0,
-                {
-                    "id": item_id,
-                    "impact": impact2,
-                    "name": name,
-                    "url": url,
-                    "snippet": snippet,
-                    "snippet_full": snippet_full_for_state,
-                    "diff": stats_for_state,
-                    "score": score,
-                    "reasons": reasons,
-                    "summary_ja": summary_ja,
-                    "pubDate": utc_now_rfc822(),
-                    "run_at": run_at,
-                    "run_id": run_id,
-                },
-            )
-            existing_ids.add(item_id)
-            new_items.append(state[0])
-            added_total += 1
-            if impact2 in added_by_impact:
-                added_by_impact[impact2] += 1
-
-        if log_diff_stats:
-            print(
-                f"[{impact2}] {name} : 変更あり (score={score}, +{stats_for_state['added']}/-{stats_for_state['removed']}, churn={stats_for_state['churn']})"
-            )
-        else:
-            print(f"[{impact2}] {name} : 変更あり (score={score})")
+                print(f"[{impact2}] {name} : 変更あり (score={score})")
+
+        for idx, fut in pending_summaries:
+            item = new_items[idx]
+            item["summary_ja"], health_line = fut.result()
+            if health_line:
+                print(health_line)
+            if not item["summary_ja"]:
+                print(f"[{item['impact']}] {item['name']} : 要約生成に失敗（空のまま継続）")
 
     # 履歴は上限で刈る
     state = state[:MAX_ITEMS]